@@ -7,146 +7,213 @@ Core transcription logic with parallel chunk processing.
 
 import os
 import sys
-import subprocess
-import shutil
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import math
 import json
-import tempfile
-import time
-import re
+import bisect
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 import threading
-import whisper
+import queue
+import ctranslate2
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from faster_whisper import __version__ as faster_whisper_version
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
 from tqdm import tqdm
 
-# Force unbuffered output so progress bars from child processes display properly
-os.environ['PYTHONUNBUFFERED'] = '1'
-
-class TqdmProgressCapture(tqdm):
-    """Custom tqdm wrapper that captures Whisper's progress and writes to JSON."""
-
-    def __init__(self, *args, progress_file=None, chunk_num=None, **kwargs):
-        self.progress_file = progress_file
-        self.chunk_num = chunk_num
-        # Redirect file to devnull to suppress terminal output, but keep tqdm functional
-        import io
-        kwargs['file'] = io.StringIO()
-        super().__init__(*args, **kwargs)
-        # Write initial state
-        self._write_progress()
-
-    def update(self, n=1):
-        """Override update to capture progress."""
-        # Manually update self.n since parent class won't due to StringIO redirection
-        self.n = min(self.n + n, self.total) if self.total else self.n + n
-        # Write progress to JSON
-        self._write_progress()
-        return True
-
-    def close(self):
-        """Override close to capture final progress."""
-        result = super().close()
-        self._write_progress()
-        return result
-
-    def _write_progress(self):
-        """Write current progress to JSON file."""
-        if self.progress_file and self.total:
-            progress_data = {
-                "chunk": self.chunk_num,
-                "current": int(self.n),
-                "total": int(self.total),
-                "percent": int((self.n / self.total * 100) if self.total > 0 else 0),
-                "status": "transcribing"
-            }
-            try:
-                with open(self.progress_file, 'w') as f:
-                    json.dump(progress_data, f)
-            except:
-                pass
+# Whisper works on 16 kHz audio
+SAMPLE_RATE = 16000
+
+# Silence at least this long ends a speech segment of a window; segments are packed
+# into windows, and only the gaps between windows are skipped
+VAD_MIN_SILENCE_MS = 500
+
+# Chunks are cut in the middle of silences at least this long
+SPLIT_MIN_SILENCE_MS = 300
+
+# Speech is padded by this much on each side before it is packed into windows
+SPEECH_PAD_MS = 400
 
+# Longest speech window fed to Whisper in one pass
+WINDOW_SECONDS = 30
 
-def transcribe_chunk(chunk_num, chunk_file, output_dir, model_size="base", lang_code="en", temp_dir=None):
+# Longest chunk handed to one worker; long videos get more chunks than workers
+MAX_CHUNK_SECONDS = 600
+
+# Bump when the meaning or format of cached VAD results changes
+VAD_CACHE_VERSION = 2
+
+# Least recently used VAD results beyond this many are deleted from the cache
+VAD_CACHE_MAX_FILES = 200
+
+# Windows batched per forward pass, shared between workers: fewer workers
+# means larger batches inside each one
+TOTAL_BATCH_SIZE = 16
+
+
+def detect_device():
     """
-    Transcribe a single video chunk (runs in separate process).
-    Each process loads its own Whisper model instance.
-    Writes real Whisper progress to JSON file for monitoring.
+    Pick the inference device: every visible CUDA GPU with float16, else CPU with int8.
+    Returns (device, compute_type, device_index).
     """
-    try:
-        # Suppress warnings from Whisper
-        import warnings
-        warnings.filterwarnings('ignore')
-
-        # Redirect both stdout and stderr to suppress Whisper's terminal output
-        import io
-        original_stdout = sys.stdout
-        original_stderr = sys.stderr
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
-
-        # Set up progress file
-        progress_file = None
-        if temp_dir:
-            progress_file = Path(temp_dir) / f"progress_chunk_{chunk_num}.json"
-
-        def write_progress(current, total, status="running"):
-            """Write progress to JSON file."""
-            if progress_file:
-                progress_data = {
-                    "chunk": chunk_num,
-                    "current": current,
-                    "total": total,
-                    "percent": int((current / total * 100) if total > 0 else 0),
-                    "status": status
-                }
-                try:
-                    with open(progress_file, 'w') as f:
-                        json.dump(progress_data, f)
-                except:
-                    pass
+    gpu_count = ctranslate2.get_cuda_device_count()
+    if gpu_count > 0:
+        # CTranslate2 spreads model workers across all listed GPUs
+        return "cuda", "float16", list(range(gpu_count))
+    return "cpu", "int8", 0
 
-        write_progress(0, 1, "starting")
 
-        # Stagger model loading by waiting for previous chunk to reach 2% progress
-        if chunk_num > 1 and temp_dir:
-            import time as time_module
-            previous_chunk_progress = temp_dir / f"progress_chunk_{chunk_num - 1}.json"
+def detect_speech(audio, cache_dir=None):
+    """
+    Run Silero VAD once over the whole file and return its speech segments as
+    {"start": sample, "end": sample} dicts. Segments end at silences of SPLIT_MIN_SILENCE_MS
+    and are unpadded, so the gaps between them are the actual pauses; both the chunk cut
+    points and each chunk's windows are derived from them. The result is cached in cache_dir under a hash of the samples,
+    the VAD options and the faster-whisper version, and reused by later runs.
+    """
+    vad_options = VadOptions(
+        # The shorter of the two silence lengths; get_speech_windows() rejoins
+        # segments split by pauses shorter than VAD_MIN_SILENCE_MS
+        min_silence_duration_ms=min(SPLIT_MIN_SILENCE_MS, VAD_MIN_SILENCE_MS),
+        speech_pad_ms=0,
+        # Leave room for the padding added by get_speech_windows()
+        max_speech_duration_s=WINDOW_SECONDS - 2 * SPEECH_PAD_MS / 1000
+    )
+
+    cache_file = None
+    if cache_dir is not None:
+        # Any change to the options, the bundled VAD model or the cache format gives a new key
+        key = hashlib.sha256(audio.tobytes())
+        key.update(json.dumps({
+            "version": VAD_CACHE_VERSION,
+            "faster_whisper": faster_whisper_version,
+            "options": vars(vad_options)
+        }, sort_keys=True).encode())
+        cache_file = Path(cache_dir) / f"{key.hexdigest()}.json"
+        try:
+            speech = json.loads(cache_file.read_text())
+            # Mark as recently used so pruning keeps it
+            cache_file.touch()
+            return speech
+        except (OSError, ValueError):
+            pass
+    speech = [
+        {"start": segment["start"], "end": segment["end"]}
+        for segment in get_speech_timestamps(audio, vad_options)
+    ]
 
-            # Wait for previous chunk to reach 2% before starting
-            while True:
-                if previous_chunk_progress.exists():
-                    try:
-                        with open(previous_chunk_progress, 'r') as f:
-                            prev_data = json.load(f)
-                            prev_percent = prev_data.get("percent", 0)
-                            if prev_percent >= 2:
-                                break  # Previous chunk is at 2%, we can start
-                    except:
-                        pass
-                time_module.sleep(0.5)  # Check every 0.5 seconds
-
-        # Load model in this process FIRST (before patching)
-        write_progress(0, 1, "loading_model")
-        model = whisper.load_model(model_size)
-        write_progress(0, 1, "model_loaded")
-
-        # NOW patch tqdm globally in sys.modules (after model is loaded)
-        import tqdm as tqdm_module
-        original_tqdm_class = tqdm_module.tqdm
-
-        # Create a wrapper class that returns our custom tqdm
-        def create_custom_tqdm(*args, **kwargs):
-            """Replace tqdm with our custom version that captures progress."""
-            kwargs['progress_file'] = progress_file
-            kwargs['chunk_num'] = chunk_num
-            return TqdmProgressCapture(*args, **kwargs)
-
-        # Patch tqdm globally
-        tqdm_module.tqdm = create_custom_tqdm
-        sys.modules['tqdm'].tqdm = create_custom_tqdm
-
-        # Transcribe with verbose=True to enable progress tracking
+    if cache_file is not None:
+        # A missing cache only costs a VAD pass next time
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(speech))
+        except OSError:
+            pass
+        prune_vad_cache(cache_dir)
+    return speech
+
+
+def prune_vad_cache(cache_dir):
+    """
+    Keep the VAD cache bounded: delete the least recently used results beyond
+    VAD_CACHE_MAX_FILES, including those left behind under older cache keys.
+    """
+    try:
+        cached = sorted(Path(cache_dir).glob("*.json"), key=lambda f: f.stat().st_mtime, reverse=True)
+        for stale in cached[VAD_CACHE_MAX_FILES:]:
+            stale.unlink()
+    except OSError:
+        # Another video may be pruning at the same time; the next write retries
+        pass
+
+
+def find_silence_cuts(speech, total_samples, num_chunks):
+    """
+    Choose num_chunks - 1 cut points (sample indices) for splitting the audio.
+    Each cut is the middle of the pause between two speech segments that is
+    nearest to the uniform boundary, within a quarter chunk of it, so words are
+    not cut in half and chunk lengths stay within 0.5x-1.5x of the average. Falls back to
+    the uniform boundary where no pause is close enough.
+    """
+    if num_chunks < 2:
+        return []
+    chunk_samples = total_samples // num_chunks
+    targets = [i * chunk_samples for i in range(1, num_chunks)]
+
+    # Segments split only to respect the window length can touch or sit just apart;
+    # only gaps of at least SPLIT_MIN_SILENCE_MS are real pauses
+    min_pause = SPLIT_MIN_SILENCE_MS * SAMPLE_RATE // 1000
+    pauses = [
+        (prev["end"] + nxt["start"]) // 2
+        for prev, nxt in zip(speech, speech[1:])
+        if nxt["start"] - prev["end"] >= min_pause
+    ]
+
+    max_shift = chunk_samples // 4
+    cuts = []
+    for target in targets:
+        # Nearest pause on either side of the target
+        pos = bisect.bisect_left(pauses, target)
+        nearby = [p for p in pauses[max(pos - 1, 0):pos + 1] if abs(p - target) < max_shift]
+        cuts.append(min(nearby, key=lambda p: abs(p - target)) if nearby else target)
+    return cuts
+
+
+def get_speech_windows(speech, start, end):
+    """
+    Speech windows for the chunk [start, end): the file's speech segments inside it,
+    rejoined across pauses shorter than VAD_MIN_SILENCE_MS, padded by SPEECH_PAD_MS
+    and packed into windows of up to WINDOW_SECONDS.
+    Returns {"start": sample, "end": sample} dicts relative to the chunk start,
+    the clip_timestamps format of the batched pipeline in faster-whisper 1.1.x.
+    """
+    pad = SPEECH_PAD_MS * SAMPLE_RATE // 1000
+    min_gap = VAD_MIN_SILENCE_MS * SAMPLE_RATE // 1000
+    # A rejoined segment must still fit in a window once padded
+    max_length = WINDOW_SECONDS * SAMPLE_RATE - 2 * pad
+
+    segments = []
+    for segment in speech:
+        if segment["end"] <= start or segment["start"] >= end:
+            continue
+        if (segments and segment["start"] - segments[-1]["end"] < min_gap
+                and segment["end"] - segments[-1]["start"] <= max_length):
+            segments[-1] = {"start": segments[-1]["start"], "end": segment["end"]}
+        else:
+            segments.append(segment)
+
+    padded = []
+    for i, segment in enumerate(segments):
+        # Pad each side, but never past the chunk edge or the middle of the pause
+        # to the neighbouring segment, so padded segments never overlap
+        low = start if i == 0 else (segments[i - 1]["end"] + segment["start"]) // 2
+        high = end if i == len(segments) - 1 else (segment["end"] + segments[i + 1]["start"]) // 2
+        padded.append({
+            "start": max(segment["start"] - pad, low, start) - start,
+            "end": min(segment["end"] + pad, high, end) - start
+        })
+
+    # Padding is already applied, so merge_segments() must not adjust the edges again
+    merge_options = VadOptions(max_speech_duration_s=WINDOW_SECONDS, speech_pad_ms=0)
+    return [
+        {"start": window["start"], "end": window["end"]}
+        for window in merge_segments(padded, merge_options)
+    ]
+
+
+def transcribe_chunk(model, chunk_num, audio, windows, lang_code="en", progress_queue=None, batch_size=8,
+                     stop_event=None):
+    """
+    Transcribe the speech windows of a single audio chunk (runs in a pool worker thread).
+    All worker threads share one WhisperModel; CTranslate2 runs concurrent calls
+    on separate model workers and releases the GIL while computing.
+    Pushes (chunk_num, current, total) to progress_queue as segments are decoded,
+    and gives up between segments once stop_event is set (Ctrl+C).
+    Returns (chunk_num, True, transcript_text) or (chunk_num, False, error).
+    """
+    try:
         # Pass None for language if auto-detect is requested
         whisper_lang = None if lang_code == "auto" else lang_code
 
@@ -156,46 +223,47 @@ def transcribe_chunk(chunk_num, chunk_file, output_dir, model_size="base", lang_
         if lang_code == "hi":
             initial_prompt = "नमस्ते, यह एक हिंदी ऑडियो है।"
 
-        result = model.transcribe(
-            str(chunk_file),
+        # A chunk with no speech has nothing to transcribe
+        if not windows:
+            return (chunk_num, True, "")
+        if stop_event is not None and stop_event.is_set():
+            return (chunk_num, False, "Interrupted")
+
+        # The windows are encoded in batches. Segments are decoded lazily, one batch
+        # at a time, and keep their timestamps on the original (unfiltered) timeline.
+        # The pipeline is a thin per-call wrapper, so threads never share its state.
+        pipeline = BatchedInferencePipeline(model=model)
+        segments, info = pipeline.transcribe(
+            audio,
             language=whisper_lang,
+            task="transcribe",
             initial_prompt=initial_prompt,
-            verbose=True,  # Enable Whisper's progress (will be captured by our custom tqdm)
-            fp16=False  # Disable FP16 since it's not supported on CPU
+            beam_size=1,
+            # Output is plain text: no timestamp tokens, no word alignment pass, and
+            # no dependency of one window on the previous window's text
+            without_timestamps=True,
+            word_timestamps=False,
+            condition_on_previous_text=False,
+            # Sample offsets, as faster-whisper 1.1.x expects (requirements.txt pins <1.2);
+            # 1.2 reads clip_timestamps as seconds and would need them divided by SAMPLE_RATE
+            clip_timestamps=windows,
+            batch_size=batch_size
         )
 
-        write_progress(1, 1, "transcribed")
-
-        # Save transcription
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file = output_dir / f"chunk_{chunk_num}.txt"
-        with open(output_file, 'w') as f:
-            for segment in result.get("segments", []):
-                text = segment.get("text", "").strip()
-                if text:
-                    f.write(text + "\n")
-
-        write_progress(1, 1, "complete")
-
-        # Restore stdout, stderr and tqdm
-        sys.stdout = original_stdout
-        sys.stderr = original_stderr
-        tqdm_module.tqdm = original_tqdm_class
-        sys.modules['tqdm'].tqdm = original_tqdm_class
-        return (chunk_num, True, None)
+        # Collect transcription, reporting progress as each segment is decoded
+        lines = []
+        for segment in segments:
+            if stop_event is not None and stop_event.is_set():
+                return (chunk_num, False, "Interrupted")
+            text = segment.text.strip()
+            if text:
+                lines.append(text)
+            if progress_queue is not None:
+                progress_queue.put_nowait((chunk_num, min(segment.end, info.duration), info.duration))
+        transcript = "\n".join(lines) + "\n" if lines else ""
+
+        return (chunk_num, True, transcript)
     except Exception as e:
-        # Restore stdout, stderr and tqdm in case of error
-        try:
-            if 'original_stdout' in locals():
-                sys.stdout = original_stdout
-            if 'original_stderr' in locals():
-                sys.stderr = original_stderr
-            if 'original_tqdm_class' in locals():
-                import tqdm as tqdm_module
-                tqdm_module.tqdm = original_tqdm_class
-                sys.modules['tqdm'].tqdm = original_tqdm_class
-        except:
-            pass
         return (chunk_num, False, str(e))
 
 class VideoTranscriber:
@@ -203,9 +271,12 @@ class VideoTranscriber:
         self.script_dir = Path(__file__).parent.parent.absolute()  # Go up to Transcriptions folder
         self.input_dir = self.script_dir / "input"
         self.output_dir = self.script_dir / "output"
-        self.temp_dir = self.script_dir / ".temp_chunks"
+        # VAD results live next to setup's venv archives (~/.cache/fastscribe unless XDG_CACHE_HOME is set)
+        cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        self.vad_cache_dir = cache_root / "fastscribe" / "vad"
         self.max_threads = max_threads
-        self.num_chunk_threads = max_threads
+        # Chunk workers never exceed the CPU count; chunks per video depend on its length
+        self.num_chunk_threads = min(max_threads, os.cpu_count() or 1)
         self.lang_code = lang_code
         # Map language codes to readable names
         self.language_names = {
@@ -214,256 +285,204 @@ class VideoTranscriber:
             "auto": "Auto-detect"
         }
         self.language = self.language_names.get(lang_code, lang_code.upper())
-        self.cleanup = True
         self.model_size = model_size
-
-        print(f"Loading Whisper model: {model_size}...")
-        self.model = whisper.load_model(model_size)
-        print(f"✓ Model loaded successfully")
-        print()
+        self.batch_size = max(1, TOTAL_BATCH_SIZE // self.num_chunk_threads)
+        self.executor = None
+        self.model = None
+        self.model_lock = threading.Lock()
+        # Set by run() on Ctrl+C; SIGINT only reaches the main thread, so the
+        # video and chunk threads poll this to stop early
+        self.stop_event = threading.Event()
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def get_video_duration(self, video_path):
-        """Get video duration in seconds using ffprobe."""
-        try:
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(video_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+    def get_model(self):
+        """
+        Return the shared Whisper model, loading it on first use.
+        The lock serializes loading: concurrent videos wait for the single load
+        instead of polling, and runs with no videos never load a model.
+        """
+        with self.model_lock:
+            if self.model is None:
+                device, compute_type, device_index = detect_device()
+                if device == "cuda":
+                    # A visible GPU only means the driver is installed; cuBLAS/cuDNN may
+                    # be missing, and they are loaded lazily, so run one encode to find out
+                    try:
+                        model = self.load_model(device, compute_type, device_index)
+                        silence = np.zeros(SAMPLE_RATE * WINDOW_SECONDS, dtype=np.float32)
+                        model.encode(model.feature_extractor(silence)[..., :-1])
+                        self.model = model
+                    except Exception as e:
+                        print(f"Warning: Could not use CUDA ({e})")
+                        print("Falling back to CPU...")
+                        device, compute_type, device_index = "cpu", "int8", 0
+                if self.model is None:
+                    self.model = self.load_model(device, compute_type, device_index)
+                print(f"✓ Model loaded successfully")
+                print()
+        return self.model
+
+    def load_model(self, device, compute_type, device_index):
+        """
+        Load the Whisper model on the given device.
+        One model for the whole run, shared by every chunk worker thread: a single
+        copy of the weights, with one CTranslate2 worker per concurrent chunk.
+        float16 on GPU; int8 on CPU needs far less memory bandwidth than FP32.
+        """
+        print(f"Loading Whisper model: {self.model_size} ({device}, {compute_type})...")
+        # On CPU, split the cores between the workers; by default every worker starts
+        # its own full-size thread pool and N workers oversubscribe the CPU
+        cpu_threads = 0
+        if device == "cpu":
+            cpu_threads = max(1, (os.cpu_count() or 1) // self.num_chunk_threads)
+        return WhisperModel(
+            self.model_size,
+            device=device,
+            device_index=device_index,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=self.num_chunk_threads
+        )
 
-            duration_str = result.stdout.strip()
-            if duration_str and duration_str != "N/A":
-                return float(duration_str)
-            return None
+    def decode_audio(self, video_path):
+        """
+        Decode the video's audio track once to 16 kHz mono float32 samples.
+        Uses PyAV (libav bindings) in-process, so no ffmpeg subprocess is spawned.
+        """
+        try:
+            return decode_audio(str(video_path), sampling_rate=SAMPLE_RATE)
         except Exception as e:
-            print(f"Error getting video duration: {e}")
+            print(f"Error decoding audio: {e}")
             return None
 
-    def split_video_into_chunks(self, video_path, num_chunks):
-        """Split video into chunks using parallel FFmpeg processes."""
-        duration = self.get_video_duration(video_path)
-
-        if duration is None:
-            print(f"Error: Could not determine video duration. Make sure FFmpeg is installed.")
-            return False
+    def split_audio_into_chunks(self, video_path):
+        """
+        Decode audio once and split it into sample ranges cut at pauses in speech.
+        Uses at least one chunk per worker and about MAX_CHUNK_SECONDS per chunk at most.
+        Returns a list of (zero-copy chunk view, speech windows) pairs, or None on failure.
+        """
+        print("Decoding audio...")
+        audio = self.decode_audio(video_path)
+
+        if audio is None or len(audio) == 0:
+            print(f"Error: Could not decode audio. Make sure the file has an audio track.")
+            return None
 
-        chunk_duration = duration / num_chunks
+        total_samples = len(audio)
+        duration = total_samples / SAMPLE_RATE
+        num_chunks = max(self.num_chunk_threads, math.ceil(duration / MAX_CHUNK_SECONDS))
+        chunk_samples = total_samples // num_chunks
 
         print(f"Video Duration: {duration:.0f} seconds")
-        print(f"Chunk Duration: {chunk_duration:.0f} seconds")
+        print(f"Chunk Duration: ~{chunk_samples / SAMPLE_RATE:.0f} seconds (cut at pauses)")
         print()
 
-        # Clean and create temp directory
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-
-        print(f"Splitting video into {num_chunks} chunks...")
-
-        # Helper function to create a single chunk
-        def create_chunk(chunk_index):
-            """Create a single video chunk using FFmpeg."""
-            start_time = (chunk_index - 1) * chunk_duration
-            chunk_output = self.temp_dir / f"chunk_{chunk_index}.mp4"
-
-            if chunk_index == num_chunks:
-                # Last chunk: no duration limit
-                cmd = [
-                    "ffmpeg", "-i", str(video_path),
-                    "-ss", str(start_time),
-                    "-c", "copy", "-y",
-                    str(chunk_output)
-                ]
-            else:
-                cmd = [
-                    "ffmpeg", "-i", str(video_path),
-                    "-ss", str(start_time),
-                    "-t", str(chunk_duration),
-                    "-c", "copy", "-y",
-                    str(chunk_output)
-                ]
+        # One VAD pass over the whole file (cached across runs) gives both the cut
+        # points and every chunk's speech windows
+        print("Detecting speech...")
+        speech = detect_speech(audio, self.vad_cache_dir)
 
-            try:
-                subprocess.run(cmd, capture_output=True, timeout=300)
-                return (chunk_index, True, None)
-            except Exception as e:
-                return (chunk_index, False, str(e))
-
-        # Create all chunks in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=num_chunks) as executor:
-            futures = {executor.submit(create_chunk, i): i for i in range(1, num_chunks + 1)}
-
-            # Collect results
-            for future in as_completed(futures):
-                chunk_num, success, error = future.result()
-                if not success:
-                    print(f"Error creating chunk {chunk_num}: {error}")
-                    return False
-
-        # Verify chunks
-        print("Verifying chunks...")
-        for i in range(1, num_chunks + 1):
-            chunk_file = self.temp_dir / f"chunk_{i}.mp4"
-            if chunk_file.exists():
-                chunk_dur = self.get_video_duration(chunk_file)
-                if chunk_dur:
-                    print(f"  ✓ Chunk {i} created: {chunk_dur:.0f} seconds")
-                else:
-                    print(f"  ✗ Chunk {i} duration unknown")
-            else:
-                print(f"  ✗ Chunk {i} missing!")
-                return False
+        # Chunk boundaries are sample indices placed in silences near the equal split points
+        boundaries = [0] + find_silence_cuts(speech, total_samples, num_chunks) + [total_samples]
+        chunks = [
+            (audio[start:end], get_speech_windows(speech, start, end))
+            for start, end in zip(boundaries, boundaries[1:])
+        ]
 
-        print("✓ Video splitting complete")
+        print(f"✓ Audio split into {num_chunks} chunks")
         print()
-        return True
-
+        return chunks
 
     def process_video(self, video_path, current, total):
         """Process a single video file."""
+        if self.stop_event.is_set():
+            return False
         video_name = video_path.name
         name_no_ext = video_path.stem
-        num_chunks = self.num_chunk_threads
 
         print("=" * 50)
         print(f"File {current}/{total}: {video_name}")
         print(f"Language: {self.language}")
-        print(f"Processing with {num_chunks} parallel jobs")
+        print(f"Processing with {self.num_chunk_threads} parallel jobs")
         print("=" * 50)
         print()
 
-        # Split video (now parallelized internally with ThreadPoolExecutor)
-        if not self.split_video_into_chunks(video_path, num_chunks):
+        # Decode audio once; workers read their slice of the same array
+        chunks = self.split_audio_into_chunks(video_path)
+        if chunks is None:
             print(f"Failed to split video: {video_name}")
             return False
+        num_chunks = len(chunks)
 
-        # Transcribe chunks in parallel using ProcessPoolExecutor
+        model = self.get_model()
+        if self.stop_event.is_set():
+            return False
+
+        # Transcribe chunks in parallel on the shared worker pool
         print(f"Starting parallel transcription of {num_chunks} chunks...")
         print()
 
         results = {}
 
-        # Start monitoring thread for progress display
-        progress_bars = {}
-        stop_monitor = threading.Event()
-
-        def monitor_progress():
-            """Monitor progress files and display percentage-based progress bars."""
-            import time as time_module
-
-            # Initialize progress bars (100% scale)
-            for i in range(1, num_chunks + 1):
-                progress_bars[i] = tqdm(
-                    total=100,
-                    desc=f"Chunk {i}",
-                    position=i-1,
-                    leave=True,
-                    unit="%",
-                    bar_format='{desc}: {percentage:3.0f}%|{bar}| [{elapsed}<{remaining}]'
-                )
-
-            last_percent = {i: 0 for i in range(1, num_chunks + 1)}
-
-            # Continue reading until all chunks complete
-            while True:
-                all_done = True
-
-                for i in range(1, num_chunks + 1):
-                    progress_file = self.temp_dir / f"progress_chunk_{i}.json"
-
-                    if progress_file.exists():
-                        try:
-                            with open(progress_file, 'r') as f:
-                                data = json.load(f)
-                                percent = data.get("percent", 0)
-                                status = data.get("status", "running")
-
-                                # Update progress bar with percentage
-                                if percent > last_percent[i]:
-                                    delta = percent - last_percent[i]
-                                    progress_bars[i].update(delta)
-                                    last_percent[i] = percent
-
-                                if status != "complete":
-                                    all_done = False
-                        except:
-                            pass
-                    else:
-                        all_done = False
-
-                # Exit only when stop_monitor is set AND all chunks are complete
-                if stop_monitor.is_set() and all_done:
-                    break
-
-                time_module.sleep(0.5)
-
-            # Close all progress bars
-            for bar in progress_bars.values():
-                bar.close()
+        # Progress bars are drawn from this thread (100% scale)
+        progress_queue = queue.Queue()
+        progress_bars = {
+            i: tqdm(
+                total=100,
+                desc=f"Chunk {i}",
+                position=i-1,
+                leave=True,
+                unit="%",
+                bar_format='{desc}: {percentage:3.0f}%|{bar}| [{elapsed}<{remaining}]'
+            )
+            for i in range(1, num_chunks + 1)
+        }
 
-        monitor_thread = threading.Thread(target=monitor_progress, daemon=True)
-        monitor_thread.start()
+        def show_progress(chunk_num, current, total):
+            """Advance a chunk's progress bar to current/total."""
+            bar = progress_bars[chunk_num]
+            percent = int((current / total * 100) if total > 0 else 0)
+            if percent > bar.n:
+                bar.update(percent - bar.n)
 
-        executor = ProcessPoolExecutor(max_workers=self.num_chunk_threads)
         try:
-            futures = {}
-
-            # Submit all chunks for transcription
-            for i in range(1, num_chunks + 1):
-                chunk_file = self.temp_dir / f"chunk_{i}.mp4"
-                output_dir = self.temp_dir / f"output_chunk_{i}"
-
-                future = executor.submit(
+            # Queue all chunks on the shared worker pool
+            futures = [
+                self.executor.submit(
                     transcribe_chunk,
+                    model,
                     i,
-                    chunk_file,
-                    output_dir,
-                    self.model_size,
+                    chunk_audio,
+                    windows,
                     self.lang_code,
-                    self.temp_dir  # Pass temp_dir for progress file writing
+                    progress_queue,
+                    self.batch_size,
+                    self.stop_event
                 )
-                futures[future] = i
+                for i, (chunk_audio, windows) in enumerate(chunks, 1)
+            ]
 
-            # Collect results as chunks complete (progress bars display above)
-            for future in as_completed(futures):
-                chunk_num, success, error = future.result()
-                results[chunk_num] = (success, error)
-
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Transcription interrupted by user (Ctrl+C)")
-            print("Cleaning up processes...")
-
-            # Stop monitoring thread
-            stop_monitor.set()
-            monitor_thread.join(timeout=1)
-
-            # Shutdown executor and terminate all running processes
-            executor.shutdown(wait=False, cancel_futures=True)
+            # Apply progress updates as they arrive until every chunk has finished
+            while not all(future.done() for future in futures):
+                if self.stop_event.is_set():
+                    return False
+                try:
+                    show_progress(*progress_queue.get(timeout=0.1))
+                except queue.Empty:
+                    pass
 
-            # Clean up temp chunks directory
-            if self.temp_dir.exists():
-                print("Removing temporary files...")
-                shutil.rmtree(self.temp_dir)
-
-            print("✓ Cleanup complete")
-            return False
+            # Collect results in chunk order
+            for future in futures:
+                chunk_num, success, payload = future.result()
+                results[chunk_num] = (success, payload)
+                if success:
+                    show_progress(chunk_num, 1, 1)
 
         finally:
-            # Ensure executor is always closed
-            executor.shutdown(wait=True)
-
-        # Stop monitoring thread
-        stop_monitor.set()
-        monitor_thread.join(timeout=2)
+            for bar in progress_bars.values():
+                bar.close()
 
         # Check for errors
         failed = {n: e for n, (s, e) in results.items() if not s}
@@ -477,33 +496,23 @@ class VideoTranscriber:
         print()
         print("Combining transcripts...")
 
-        # Combine transcripts
+        # Combine transcripts in chunk order; a failed chunk leaves a marker in its place
+        # so a partial transcript can't be mistaken for a complete one
         final_transcript = self.output_dir / f"{name_no_ext}.txt"
+        chunk_texts = [
+            results[i][1] if i not in failed else f"[Chunk {i} missing: transcription failed]\n"
+            for i in range(1, num_chunks + 1)
+        ]
         with open(final_transcript, 'w') as outfile:
-            for i in range(1, num_chunks + 1):
-                chunk_transcript = self.temp_dir / f"output_chunk_{i}" / f"chunk_{i}.txt"
-                if chunk_transcript.exists():
-                    with open(chunk_transcript, 'r') as infile:
-                        outfile.write(infile.read())
-                else:
-                    print(f"Warning: Transcript for chunk {i} not found")
-
-        print("✓ Transcription complete!")
-        print(f"Output: {final_transcript}")
-        print()
+            outfile.write("".join(chunk_texts))
 
-        # Cleanup
-        if self.cleanup:
-            print("Cleaning up temporary chunks...")
-            if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
-            print("✓ Cleanup complete")
+        if failed:
+            print(f"⚠️  Transcript is incomplete: chunk(s) {', '.join(map(str, failed))} missing")
         else:
-            print(f"Note: Temporary chunks saved in: {self.temp_dir}")
-            print(f"To clean up later, run: rm -rf \"{self.temp_dir}\"")
-
+            print("✓ Transcription complete!")
+        print(f"Output: {final_transcript}")
         print()
-        return True
+        return not failed
 
     def run(self):
         """Main execution method."""
@@ -515,9 +524,6 @@ class VideoTranscriber:
         print("=" * 50)
         print()
 
-        print(f"Cleanup: Auto-cleanup enabled")
-        print()
-
         # Find video files
         video_files = sorted(self.input_dir.glob("*.mp4"))
 
@@ -529,20 +535,37 @@ class VideoTranscriber:
         print(f"Starting background transcription ({self.max_threads} thread{'s' if self.max_threads > 1 else ''})...")
         print()
 
-        # Process videos in background threads
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            futures = {
-                executor.submit(self.process_video, video_path, current, len(video_files)): current
-                for current, video_path in enumerate(video_files, 1)
-            }
+        # Persistent worker pool shared by all videos; every worker thread
+        # transcribes with the same loaded model
+        self.executor = ThreadPoolExecutor(max_workers=self.num_chunk_threads)
+
+        try:
+            # Process videos in background threads
+            with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                futures = {
+                    executor.submit(self.process_video, video_path, current, len(video_files)): current
+                    for current, video_path in enumerate(video_files, 1)
+                }
 
-            # Wait for all tasks to complete
-            for future in as_completed(futures):
-                video_num = futures[future]
+                # Wait for all tasks to complete
                 try:
-                    future.result()
-                except Exception as e:
-                    print(f"Error processing video {video_num}: {e}")
+                    for future in as_completed(futures):
+                        video_num = futures[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            print(f"Error processing video {video_num}: {e}")
+                except KeyboardInterrupt:
+                    # Ctrl+C lands here, in the main thread: tell the video and chunk
+                    # threads to stop and drop everything that has not started yet
+                    print("\n\n⚠️  Stopping workers...")
+                    self.stop_event.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self.executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            # Ensure worker pool is always closed
+            self.executor.shutdown(wait=True)
 
         print("=" * 50)
         print("All transcriptions complete!")
@@ -695,5 +718,6 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        # Exit silently, let outer script handle the message
+        # transcribe.py execs this script on POSIX, so there is no outer script to report it
+        print("\nInterrupted by user")
         sys.exit(130)  # Standard exit code for Ctrl+C
@@ -7,19 +7,45 @@ This script creates a local venv so all packages are isolated to this project
 
 import os
 import sys
-import subprocess
-import venv
+import json
+import shutil
+import hashlib
 from pathlib import Path
 
-
-def run_command(cmd, description=""):
-    """Run a shell command and return success status."""
+# Project root directory (where this script is located), resolved once
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# venv, subprocess and tarfile are imported where they are used, so paths that
+# exit early (wrong Python version, missing requirements.txt) don't load them
+
+# Written into the venv after a successful install; lets later health checks skip the full scan
+HEALTH_CACHE_NAME = ".fastscribe_health.json"
+
+# Run by the venv's Python after pip is copied in from the cache: writes the pip,
+# pip3 and pip3.X console scripts with pip's vendored distlib, as pip's own installer
+# does (on Windows this builds the .exe launchers too)
+MAKE_PIP_SCRIPTS = (
+    "import sys\n"
+    "from pip._vendor.distlib.scripts import ScriptMaker\n"
+    "maker = ScriptMaker(None, sys.argv[1])\n"
+    "maker.clobber = True\n"
+    "maker.variants = {''}\n"
+    "major, minor = sys.version_info[:2]\n"
+    "names = ['pip', f'pip{major}', f'pip{major}.{minor}']\n"
+    "maker.make_multiple([f'{name} = pip._internal.cli.main:main' for name in names])\n"
+)
+
+
+def run_command(argv, description=""):
+    """Run a command (argument list, no shell) and return success status."""
+    import subprocess
     try:
         if description:
             print(description)
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        # Output goes straight to the terminal, so pip's progress is visible as it happens
+        result = subprocess.run(argv, shell=False, check=False)
         if result.returncode != 0:
-            print(f"Error: {result.stderr}")
+            print(f"Error: command exited with status {result.returncode}")
             return False
         return True
     except Exception as e:
@@ -29,17 +55,28 @@ def run_command(cmd, description=""):
 
 def remove_directory(path):
     """Remove a directory recursively with permission handling."""
+    import subprocess
     try:
-        import shutil
-        # On macOS, sometimes shutil.rmtree fails due to permissions
-        # Use a more robust approach
-        shutil.rmtree(path, ignore_errors=True)
-
-        # If it still exists, try using system command
-        if path.exists():
-            run_command(f'rm -rf "{path}"', "")
-
-        return not path.exists()
+        # The native tools delete a venv's thousands of files faster than
+        # shutil.rmtree, and rm -rf also copes with the permission errors it hits on macOS
+        if sys.platform == "win32":
+            argv = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+        else:
+            argv = ["rm", "-rf", str(path)]
+        try:
+            result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        except OSError:
+            # Tool not available: fall back to removing it from Python
+            try:
+                shutil.rmtree(path)
+            except FileNotFoundError:
+                pass  # Already gone
+            return True
+
+        if sys.platform == "win32":
+            # rd can exit with 0 after leaving locked files behind
+            return not path.exists()
+        return result.returncode == 0
     except Exception as e:
         print(f"Warning: Could not remove directory: {e}")
         return False
@@ -50,61 +87,260 @@ def check_venv_health(venv_dir):
     if not venv_dir.exists():
         return True  # No venv exists, so it's "healthy" (will be created)
 
-    # Determine platform-specific pip path
+    # A venv verified by an earlier setup, still at the same path with an unchanged
+    # pyvenv.cfg, only needs its base interpreter to still exist
+    try:
+        record = json.loads((venv_dir / HEALTH_CACHE_NAME).read_text(encoding="utf-8"))
+        if (record["ok"] and record["venv_dir"] == str(venv_dir)
+                and record["cfg_mtime"] == (venv_dir / "pyvenv.cfg").stat().st_mtime):
+            return os.path.exists(record["home"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # No usable record: run the full check
+
+    # Determine platform-specific paths
     if sys.platform == "win32":
+        python_exe = venv_dir / "Scripts" / "python.exe"
         pip_exe = venv_dir / "Scripts" / "pip.exe"
     else:
+        python_exe = venv_dir / "bin" / "python"
         pip_exe = venv_dir / "bin" / "pip"
 
-    # Check if pip exists
-    if not pip_exe.exists():
+    # Check if the venv's Python and pip exist
+    if not python_exe.exists() or not pip_exe.exists():
         return False
 
-    # Try to read the shebang line to detect bad interpreter paths
+    # Try to read pip's shebang line to detect bad interpreter paths
     try:
         with open(pip_exe, 'rb') as f:
-            first_line = f.readline().decode('utf-8', errors='ignore').strip()
+            head = f.read(256)
+        # pip.exe on Windows is a PE launcher (starts with "MZ"), not a script;
+        # there pyvenv.cfg below is the check
+        if not head.startswith(b'MZ'):
+            first_line = head.split(b'\n', 1)[0].decode('utf-8', errors='ignore').strip()
             if first_line.startswith('#!'):
                 # Check if the interpreter path in shebang exists
                 interpreter_path = first_line[2:].strip().split()[0]
                 if not os.path.exists(interpreter_path):
                     return False
     except Exception:
-        pass  # If we can't read it, we'll try running it
+        pass  # If we can't read it, rely on pyvenv.cfg below
+
+    # The base interpreter recorded in pyvenv.cfg must still exist; this catches
+    # the same breakage as running pip, without starting a Python process
+    home = read_venv_home(venv_dir)
+    return home is not None and os.path.exists(home)
+
+
+def read_venv_home(venv_dir):
+    """Base interpreter directory from the venv's pyvenv.cfg ("home = ..."), or None."""
+    try:
+        for line in (venv_dir / "pyvenv.cfg").read_text(encoding="utf-8").splitlines():
+            key, sep, value = line.partition("=")
+            if sep and key.strip() == "home":
+                return value.strip()
+    except OSError:
+        pass
+    return None
+
+
+def save_venv_health(venv_dir):
+    """Record a verified venv so the next health check can skip the full scan."""
+    home = read_venv_home(venv_dir)
+    if home is None:
+        return
+    try:
+        record = {
+            "ok": True,
+            "venv_dir": str(venv_dir),
+            "cfg_mtime": (venv_dir / "pyvenv.cfg").stat().st_mtime,
+            "home": home
+        }
+        (venv_dir / HEALTH_CACHE_NAME).write_text(json.dumps(record), encoding="utf-8")
+    except OSError:
+        pass  # Only costs a full check next time
+
+
+def get_cache_dir():
+    """FastScribe's setup cache directory (~/.cache/fastscribe unless XDG_CACHE_HOME is set)."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "fastscribe"
+
+
+def get_site_packages(venv_dir):
+    """Platform-specific site-packages directory of a venv created by this Python."""
+    if sys.platform == "win32":
+        return venv_dir / "Lib" / "site-packages"
+    return venv_dir / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+
+
+def get_pip_cache_dir():
+    """Installed copy of pip (package plus dist-info) kept for new venvs of this Python version."""
+    return get_cache_dir() / f"pip-py{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def create_venv(venv_dir, pip_cache_dir, use_cache=True):
+    """
+    Create the venv, copying an already-installed pip from the cache into it the way
+    virtualenv seeds pip, instead of running ensurepip to unpack and install the
+    bundled wheel. Without a cache, or with use_cache=False, it uses ensurepip.
+    Returns True if pip came from the cache.
+    """
+    import venv
+    import subprocess
+    pip_from_cache = use_cache and pip_cache_dir.is_dir()
+    # Symlink the interpreter on POSIX instead of copying it (Windows venvs need copies)
+    venv.EnvBuilder(
+        with_pip=not pip_from_cache,
+        symlinks=(sys.platform != "win32"),
+        system_site_packages=False
+    ).create(venv_dir)
+    if not pip_from_cache:
+        return False
 
-    # Try running pip --version as final check
+    if sys.platform == "win32":
+        scripts_dir = venv_dir / "Scripts"
+        venv_python = scripts_dir / "python.exe"
+    else:
+        scripts_dir = venv_dir / "bin"
+        venv_python = scripts_dir / "python"
     try:
+        shutil.copytree(pip_cache_dir, get_site_packages(venv_dir), dirs_exist_ok=True)
+        # Copying the package does not create the pip commands themselves
         result = subprocess.run(
-            [str(pip_exe), '--version'],
-            capture_output=True,
-            text=True,
-            timeout=5
+            [str(venv_python), "-c", MAKE_PIP_SCRIPTS, str(scripts_dir)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
-        return result.returncode == 0
-    except Exception:
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode("utf-8", errors="replace").strip())
+        return True
+    except Exception as e:
+        print(f"Warning: Could not copy cached pip ({e}), installing it with ensurepip...")
+        # Only stderr is kept, as bytes, and decoded only if ensurepip fails
+        result = subprocess.run(
+            [str(venv_python), "-Im", "ensurepip", "--upgrade", "--default-pip"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ensurepip failed: {result.stderr.decode('utf-8', errors='replace')}")
+        return False
+
+
+def save_pip(venv_dir, pip_cache_dir):
+    """Copy the venv's installed pip into the cache for future venvs."""
+    site_packages = get_site_packages(venv_dir)
+    temp_dir = pip_cache_dir.with_name(pip_cache_dir.name + ".tmp")
+    try:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        shutil.copytree(site_packages / "pip", temp_dir / "pip")
+        for dist_info in site_packages.glob("pip-*.dist-info"):
+            shutil.copytree(dist_info, temp_dir / dist_info.name)
+        shutil.rmtree(pip_cache_dir, ignore_errors=True)
+        temp_dir.replace(pip_cache_dir)
+        return True
+    except Exception as e:
+        print(f"Warning: Could not cache pip: {e}")
+        shutil.rmtree(temp_dir, ignore_errors=True)
         return False
 
 
+def get_venv_cache_file(project_root, requirements_file):
+    """
+    Path of the cached venv archive for these requirements, this Python and this project location.
+    A venv hard-codes absolute paths (shebangs, pyvenv.cfg), so the location is part of the key.
+    The name starts with a hash of the location alone, so save_venv() can find the
+    project's older archives.
+    """
+    project = hashlib.sha256(str(project_root).encode()).hexdigest()[:8]
+    key = hashlib.sha256()
+    key.update(requirements_file.read_bytes())
+    key.update(sys.version.encode())
+    key.update(sys.executable.encode())
+    key.update(str(project_root).encode())
+    return get_cache_dir() / f"venv-{project}-{key.hexdigest()[:16]}.tar"
+
+
+def restore_venv(cache_file, venv_dir):
+    """
+    Unpack a cached venv archive into venv_dir and return success status.
+    A corrupt archive is deleted, so the venv built instead replaces it in the cache.
+    """
+    import tarfile
+    try:
+        with tarfile.open(cache_file) as archive:
+            # The archive is one we wrote ourselves; the venv's python symlink
+            # points outside the venv, which the default "data" filter rejects
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(venv_dir.parent, filter="fully_trusted")
+            else:
+                archive.extractall(venv_dir.parent)
+        return True
+    except Exception as e:
+        print(f"Warning: Could not restore cached venv: {e}")
+        remove_directory(venv_dir)
+        try:
+            cache_file.unlink(missing_ok=True)
+        except OSError:
+            pass  # Could not delete it; the next failed restore tries again
+        return False
+
+
+def save_venv(venv_dir, cache_file):
+    """
+    Archive a freshly installed venv so the next setup can restore it, and delete
+    this project's archives for older requirements or Pythons (each is hundreds of MB).
+    """
+    import tarfile
+    temp_file = cache_file.with_suffix(".tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Uncompressed: the archive stays local and packing should cost little
+        with tarfile.open(temp_file, "w") as archive:
+            archive.add(venv_dir, arcname=venv_dir.name)
+        temp_file.replace(cache_file)
+    except Exception as e:
+        print(f"Warning: Could not cache venv: {e}")
+        temp_file.unlink(missing_ok=True)
+        return False
+
+    # Archive names are "venv-<project>-<key>.tar"; everything else under this project's prefix is stale
+    project_prefix = cache_file.name.rsplit("-", 1)[0]
+    for stale in cache_file.parent.glob(f"{project_prefix}-*.tar"):
+        if stale != cache_file:
+            try:
+                stale.unlink()
+            except OSError:
+                pass  # Left for the next save
+    return True
+
+
 def main():
-    # Get project root directory (where this script is located)
-    project_root = Path(__file__).parent.absolute()
-    venv_dir = project_root / ".venv"
+    # Check Python version first, before any other work
+    if sys.version_info < (3, 9):
+        print(f"Error: Python 3.9 or later required. You have {sys.version}")
+        sys.exit(1)
+
+    venv_dir = PROJECT_ROOT / ".venv"
+
+    # Fail before touching the venv if there is nothing to install
+    # (this also covers a missing scripts/ folder)
+    requirements_file = PROJECT_ROOT / "scripts" / "requirements.txt"
+    if not requirements_file.exists():
+        print(f"Error: requirements.txt not found at {requirements_file}")
+        sys.exit(1)
 
     print("=" * 50)
     print("Setting up local environment")
     print("=" * 50)
     print()
 
-    # Check Python version
-    if sys.version_info < (3, 9):
-        print(f"Error: Python 3.9 or later required. You have {sys.version}")
-        sys.exit(1)
-
     python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
     print(f"Using Python {python_version}")
     print()
 
     # Check if venv already exists and is healthy
+    rebuild = False
     if venv_dir.exists():
         print(f"Virtual environment found at {venv_dir}")
         print("Checking virtual environment health...")
@@ -121,6 +357,8 @@ def main():
             print("✓ Virtual environment is healthy")
             response = input("Do you want to recreate it anyway? (y/n): ").strip().lower()
             if response == "y":
+                # Build from scratch rather than restoring the cached copy
+                rebuild = True
                 print("Removing existing virtual environment...")
                 if remove_directory(venv_dir):
                     print("✓ Removed existing venv")
@@ -131,11 +369,24 @@ def main():
                 print("Skipping creation. Using existing venv...")
                 print()
 
-    # Create virtual environment
+    # Restore a previously installed venv for the same requirements instead of rebuilding it
+    venv_cache_file = get_venv_cache_file(PROJECT_ROOT, requirements_file)
+    restored = False
+    if not venv_dir.exists() and not rebuild and venv_cache_file.exists():
+        print(f"Restoring virtual environment from cache ({venv_cache_file})...")
+        restored = restore_venv(venv_cache_file, venv_dir)
+        if restored:
+            print("✓ Virtual environment restored")
+        print()
+
+    # Create virtual environment, seeding pip from the cache when there is one
+    # (a rebuild uses ensurepip and upgrades pip, which also refreshes the cached copy)
+    pip_cache_dir = get_pip_cache_dir()
+    pip_from_cache = False
     if not venv_dir.exists():
         print("Creating virtual environment...")
         try:
-            venv.create(venv_dir, with_pip=True)
+            pip_from_cache = create_venv(venv_dir, pip_cache_dir, use_cache=not rebuild)
             print("✓ Virtual environment created")
             print()
         except Exception as e:
@@ -145,35 +396,15 @@ def main():
     # Determine platform-specific paths
     if sys.platform == "win32":
         python_exe = venv_dir / "Scripts" / "python.exe"
-        pip_exe = venv_dir / "Scripts" / "pip.exe"
         activate_cmd = str(venv_dir / "Scripts" / "activate.bat")
     else:
         python_exe = venv_dir / "bin" / "python"
-        pip_exe = venv_dir / "bin" / "pip"
         activate_cmd = f"source {venv_dir / 'bin' / 'activate'}"
 
-    # Upgrade pip
-    print("Upgrading pip...")
-    if not run_command(f'"{pip_exe}" install --upgrade pip', ""):
-        print("Warning: Could not upgrade pip, continuing anyway...")
-    print()
-
-    # Install requirements
-    requirements_file = project_root / "scripts" / "requirements.txt"
-    if not requirements_file.exists():
-        print(f"Error: requirements.txt not found at {requirements_file}")
-        sys.exit(1)
-
-    print("Installing packages locally (this may take a few minutes)...")
-    if not run_command(f'"{pip_exe}" install -r "{requirements_file}"', ""):
-        print("Error: Failed to install requirements")
-        sys.exit(1)
-
-    print()
-
-    # Create input and output directories
-    input_dir = project_root / "input"
-    output_dir = project_root / "output"
+    # Create input and output directories now rather than after the long install,
+    # so they exist even if the install is interrupted
+    input_dir = PROJECT_ROOT / "input"
+    output_dir = PROJECT_ROOT / "output"
 
     print("Creating project directories...")
     input_dir.mkdir(exist_ok=True)
@@ -182,6 +413,45 @@ def main():
     print(f"✓ Created {output_dir}")
     print()
 
+    # Install requirements (a restored venv already has them)
+    if not restored:
+        # Upgrade pip (if needed) and install requirements in one pip run, so pip starts only once
+        print("Installing packages locally (this may take a few minutes)...")
+        # (python -m pip, because pip.exe cannot replace itself on Windows)
+        # Bytecode is compiled afterwards on all cores instead of file by file inside pip
+        pip_install = [str(python_exe), "-m", "pip", "install", "--no-compile"]
+        if not pip_from_cache:
+            # The cached pip was current when it was saved; ensurepip's bundled one may not be
+            pip_install += ["--upgrade", "pip"]
+        # Wheels only: a package without a wheel for this platform fails fast
+        # instead of silently starting a long source build
+        pip_install += ["--prefer-binary", "--only-binary=:all:", "-r", str(requirements_file)]
+        if not run_command(pip_install, ""):
+            print("Error: Failed to install requirements")
+            print("If pip reported that no matching distribution was found, a package has no")
+            print(f"prebuilt wheel for this platform and Python {sys.version_info.major}.{sys.version_info.minor}.")
+            sys.exit(1)
+        print()
+
+        print("Compiling installed packages...")
+        compile_packages = [str(python_exe), "-m", "compileall", "-q", "-j", "0", str(get_site_packages(venv_dir))]
+        if not run_command(compile_packages, ""):
+            # Packages still work; Python compiles them on first import instead
+            print("Warning: Some packages could not be precompiled, continuing anyway...")
+        print()
+
+        save_venv_health(venv_dir)
+
+        # A pip that was just upgraded is at least as new as the cached one
+        if not pip_from_cache:
+            save_pip(venv_dir, pip_cache_dir)
+
+        if rebuild or not venv_cache_file.exists():
+            print("Caching virtual environment for future setups...")
+            if save_venv(venv_dir, venv_cache_file):
+                print(f"✓ Cached at {venv_cache_file}")
+            print()
+
     print("=" * 50)
     print("✓ Setup complete!")
     print("=" * 50)
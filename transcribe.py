@@ -5,15 +5,16 @@ FastScribe - Main Entry Point
 Activates the local virtual environment and runs the transcriber.
 """
 
+import os
 import sys
-import subprocess
 from pathlib import Path
 
+# Project root directory (where this script is located), resolved once
+PROJECT_ROOT = Path(__file__).resolve().parent
+
 
 def main():
-    # Get project root directory (where this script is located)
-    project_root = Path(__file__).parent.absolute()
-    venv_dir = project_root / ".venv"
+    venv_dir = PROJECT_ROOT / ".venv"
 
     # Determine platform-specific Python executable
     if sys.platform == "win32":
@@ -28,18 +29,29 @@ def main():
         sys.exit(1)
 
     # Path to the main transcriber script
-    transcriber_script = project_root / "scripts" / "transcribe_parallel.py"
+    transcriber_script = PROJECT_ROOT / "scripts" / "transcribe_parallel.py"
 
     # Run the transcriber with the venv's Python interpreter in unbuffered mode
+    argv = [str(python_exe), "-u", str(transcriber_script)] + sys.argv[1:]
+
+    # On POSIX, replace this process with the transcriber: no idle parent interpreter
+    # is left waiting, and Ctrl+C goes straight to the transcriber
+    if sys.platform != "win32":
+        try:
+            os.execv(argv[0], argv)
+        except OSError as e:
+            print(f"Error running transcriber: {e}")
+            sys.exit(1)
+
+    # Windows has no in-place exec (os.execv starts a new process and exits this one,
+    # so the shell would return while transcription is still running): run it as a child
+    import subprocess
     try:
-        result = subprocess.run(
-            [str(python_exe), "-u", str(transcriber_script)] + sys.argv[1:],
-            check=False
-        )
+        result = subprocess.run(argv, check=False)
         sys.exit(result.returncode)
     except KeyboardInterrupt:
-        print("\nInterrupted by user")
-        sys.exit(1)
+        # The transcriber reports the interrupt itself
+        sys.exit(130)
     except Exception as e:
         print(f"Error running transcriber: {e}")
         sys.exit(1)